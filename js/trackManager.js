@@ -120,7 +120,7 @@ export default class TrackManager {
             for (const [sectionId, jsonStr] of this.sectionTracks.entries()) {
                 try {
                     const tracks = jsonStr ? JSON.parse(jsonStr) : null;
-                    console.log(`Immediate tracks listener call for section ${sectionId}:`, tracks);
+                    this.logger.debug(`Immediate tracks listener call for section ${sectionId}:`, tracks);
                     if (tracks && tracks.length > 0) listener(sectionId, tracks);
                 } catch (e) {
                     this.logger.error('tracks listener immediate call failed for section ' + sectionId, e);
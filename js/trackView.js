@@ -149,7 +149,6 @@ export default class TrackView {
         points.forEach(element => {
             this.bounds.extend(element.position);
             this.trackPoints.push(element.position);
-            this.track.setPath(this.trackPoints);
             this.distance = element.Distance;
             // If the point doesn't have SOG, skip placing a marker
             if (element.SOG !== undefined) {
@@ -167,6 +166,8 @@ export default class TrackView {
             this.prevPointData = element;
         });
 
+        // Set the polyline path once for the whole batch rather than per point
+        this.track.setPath(this.trackPoints);
         this.updateMarkers();
 
         if (this.onBoundsChange && typeof this.onBoundsChange === 'function') {